@@ -5,9 +5,10 @@
 ##-- imports
 from __future__ import annotations
 
+import copy
 import logging as logmod
-import warnings
 import pathlib as pl
+import pickle
 from typing import (Any, Callable, ClassVar, Generic, Iterable, Iterator,
                     Mapping, Match, MutableMapping, Sequence, Tuple,
                     TypeVar, cast)
@@ -15,9 +16,14 @@ from typing import (Any, Callable, ClassVar, Generic, Iterable, Iterator,
 logging = logmod.root
 
 import pytest
+from collections import ChainMap
 from tomlguard.error import TomlAccessError
 from tomlguard.tomlguard import TomlGuard
 
+@pytest.fixture(scope="module")
+def basic():
+    return TomlGuard({"test": {"blah": 2}, "bloo": 2})
+
 class TestBaseTomlGuard:
 
     def test_initial(self):
@@ -41,6 +47,13 @@ class TestBaseTomlGuard:
         with pytest.raises(TomlAccessError):
             basic.none_existing
 
+    def test_access_error_message(self):
+        basic = TomlGuard({"test": "blah", "bloo": 2})
+        with pytest.raises(TomlAccessError) as ctx:
+            basic.none_existing
+
+        assert(str(ctx.value) == "<root>.none_existing not found, available: [test bloo]")
+
     def test_item_access_error(self):
         basic = TomlGuard({"test": "blah"})
         with pytest.raises(TomlAccessError):
@@ -50,76 +63,158 @@ class TestBaseTomlGuard:
         basic = TomlGuard({"test": "blah"})
         assert(basic.test == "blah")
 
+    def test_dash_access(self):
+        basic = TomlGuard({"a-test": "blah"})
+        assert(basic.a_test == "blah")
+
+    def test_dash_access_falsy(self):
+        basic = TomlGuard({"a-test": 0, "b-test": False})
+        assert(basic.a_test == 0)
+        assert(basic.b_test is False)
+
+    def test_dash_access_shares_wrapper(self):
+        basic = TomlGuard({"a-test": {"blah": 2}})
+        assert(basic.a_test is basic['a-test'])
+        assert(basic.a_test._index() == ("<root>", "a-test"))
+
+    def test_dash_access_after_remove_prefix(self):
+        basic = TomlGuard({"tool": {"x": {"a-b": 1}}})
+        assert(basic.remove_prefix("tool.x").a_b == 1)
+
     def test_index(self):
         basic = TomlGuard({"test": "blah"})
-        assert(basic._index() == ["<root>"])
+        assert(basic._index() == ("<root>",))
 
     def test_index_independence(self):
         basic = TomlGuard({"test": "blah"})
-        assert(basic._index() == ["<root>"])
+        assert(basic._index() == ("<root>",))
         basic.test
-        assert(basic._index() == ["<root>"])
+        assert(basic._index() == ("<root>",))
 
     def test_nested_access(self):
         basic = TomlGuard({"test": {"blah": 2}})
         assert(basic.test.blah == 2)
 
-    def test_repr(self):
-        basic = TomlGuard({"test": {"blah": 2}, "bloo": 2})
+    def test_nested_access_reuses_wrapper(self):
+        basic = TomlGuard({"test": {"blah": 2}})
+        assert(basic.test is basic.test)
+        assert(basic.test._index() == ("<root>", "test"))
+
+    def test_repr(self, basic):
+        assert(repr(basic) == "<TomlGuard:['test', 'bloo']>")
+
+    def test_repr_mutable(self):
+        basic = TomlGuard({"test": 2}, mutable=True)
+        assert(repr(basic) == "<TomlGuard:['test']>")
+        basic.bloo = 3
         assert(repr(basic) == "<TomlGuard:['test', 'bloo']>")
 
-    def test_immutable(self):
-        basic = TomlGuard({"test": {"blah": 2}, "bloo": 2})
+    def test_slotted(self, basic):
+        with pytest.raises(AttributeError):
+            object.__getattribute__(basic, "__dict__")
+
+        with pytest.raises(AttributeError):
+            object.__getattribute__(basic.test, "__dict__")
+
+    def test_copy(self, basic):
+        copied = copy.copy(basic)
+        assert(copied is not basic)
+        assert(copied.test.blah == 2)
+        assert(copied._index() == basic._index())
+
+    def test_deepcopy(self, basic):
+        copied = copy.deepcopy(basic)
+        assert(copied._table() == basic._table())
+        assert(copied._table()["test"] is not basic._table()["test"])
+        assert(copied.test.blah == 2)
+
+    def test_pickle(self, basic):
+        loaded = pickle.loads(pickle.dumps(basic.test))
+        assert(loaded.blah == 2)
+        assert(loaded._index() == ("<root>", "test"))
+
+    def test_copy_mutable(self):
+        basic  = TomlGuard({"test": 2}, mutable=True)
+        copied = copy.copy(basic)
+        copied.bloo = 3
+        assert(copied._mutable())
+        assert("bloo" not in basic)
+
+    def test_mutable_copies_data(self):
+        data  = {"test": 2}
+        basic = TomlGuard(data, mutable=True)
+        basic.bloo = 3
+        assert(basic.bloo == 3)
+        assert(data == {"test": 2})
+
+    def test_mutable_dash_assignment(self):
+        basic = TomlGuard({"a-test": 2}, mutable=True)
+        basic.a_test = 5
+        assert(basic.a_test == 5)
+        assert(dict(basic._table()) == {"a-test": 5})
+
+    def test_immutable(self, basic):
         with pytest.raises(TypeError):
             basic.test = 5
 
-    def test_uncallable(self):
-        basic = TomlGuard({"test": {"blah": 2}, "bloo": 2})
+    def test_uncallable(self, basic):
         with pytest.raises(TomlAccessError):
             basic()
 
-    def test_iter(self):
-        basic = TomlGuard({"test": {"blah": 2}, "bloo": 2})
+    def test_iter(self, basic):
         pairs = list(basic)
         assert(pairs == [("test", {"blah":2}), ("bloo", 2)])
 
-    def test_contains(self):
-        basic = TomlGuard({"test": {"blah": 2}, "bloo": 2})
+    def test_contains(self, basic):
         assert("test" in basic)
 
-    def test_contains_fail(self):
-        basic = TomlGuard({"test": {"blah": 2}, "bloo": 2})
+    def test_contains_fail(self, basic):
         assert("blah" not in basic)
 
-    def test_get(self):
-        basic = TomlGuard({"test": {"blah": 2}, "bloo": 2})
+    def test_get(self, basic):
         assert(basic.get("bloo") == 2)
 
-    def test_get_default(self):
-        basic = TomlGuard({"test": {"blah": 2}, "bloo": 2})
+    def test_get_default(self, basic):
         assert(basic.get("blah") is None)
 
-    def test_get_default_value(self):
-        basic = TomlGuard({"test": {"blah": 2}, "bloo": 2})
+    def test_get_default_value(self, basic):
         assert(basic.get("blah", 5) == 5)
 
-    def test_keys(self):
-        basic = TomlGuard({"test": {"blah": 2}, "bloo": 2})
+    def test_get_tuple(self, basic):
+        assert(basic.get(("test", "blah")) == 2)
+
+    def test_get_tuple_default(self, basic):
+        assert(basic.get(("test", "aweg"), 5) == 5)
+        assert(basic.get(("bloo", "blah"), 5) == 5)
+        assert(basic.get(("test", "blah", "bloo"), 5) == 5)
+
+    def test_keys(self, basic):
         assert(list(basic.keys()) == ["test", "bloo"])
 
-    def test_items(self):
-        basic = TomlGuard({"test": {"blah": 2}, "bloo": 2})
+    def test_items(self, basic):
         assert(list(basic.items()) == [("test", {"blah": 2}), ("bloo", 2)])
 
-    def test_values(self):
-        basic = TomlGuard({"test": {"blah": 2}, "bloo": 2})
+    def test_values(self, basic):
         assert(list(basic.values()) == [{"blah": 2}, 2])
 
+    def test_chainmap_views(self):
+        basic = TomlGuard(ChainMap({"test": 2}, {"test": 3, "bloo": 2}))
+        assert(list(basic.keys()) == ["test", "bloo"])
+        assert(list(basic.items()) == [("test", 2), ("bloo", 2)])
+        assert(list(basic.values()) == [2, 2])
+
     def test_list_access(self):
         basic = TomlGuard({"test": {"blah": [1,2,3]}, "bloo": ["a","b","c"]})
         assert(basic.test.blah == [1,2,3])
         assert(basic.bloo == ["a","b","c"])
 
+    def test_table_list_access(self):
+        basic = TomlGuard({"test": [{"blah": 1}, {"blah": 2}]})
+        first = basic.test
+        assert([x.blah for x in first] == [1, 2])
+        assert(first is not basic.test)
+        assert(all(x is y for x,y in zip(first, basic.test)))
+
     def test_contains(self):
         basic = TomlGuard({"test": {"blah": [1,2,3]}, "bloo": ["a","b","c"]})
         assert("test" in basic)
@@ -155,10 +250,30 @@ class TestTomlGuardMerge:
         assert(isinstance(simple, TomlGuard))
         assert(simple._table() == {"a": 2, "b": 5})
 
+    def test_merge_prefixed(self):
+        prefixed = TomlGuard({"tool": {"x": {"a": {"b": 1}}}}).remove_prefix("tool.x")
+        merged   = TomlGuard.merge(prefixed, {"q": 3})
+        assert(list(merged.keys()) == ["a", "q"])
+        assert(merged.a.b == 1)
+        assert(type(merged._table()["a"]) is dict)
+
+    def test_merge_prefixed_conflict(self):
+        prefixed = TomlGuard({"tool": {"x": {"a": {"b": 1}}}}).remove_prefix("tool.x")
+        with pytest.raises(KeyError) as ctx:
+            TomlGuard.merge(prefixed, {"a": 3})
+
+        assert(ctx.value.args[1] == {"a"})
+
     def test_merge_conflict(self):
         with pytest.raises(KeyError):
             TomlGuard.merge({"a":2}, {"a": 5})
 
+    def test_merge_conflict_reports_keys(self):
+        with pytest.raises(KeyError) as ctx:
+            TomlGuard.merge({"a":2, "b": 3}, {"c": 5}, {"b": 1, "a": 5})
+
+        assert(ctx.value.args[1] == {"a", "b"})
+
     def test_merge_with_shadowing(self):
         basic = TomlGuard.merge({"a":2}, {"a": 5, "b": 5}, shadow=True)
         assert(dict(basic) == {"a":2, "b": 5})
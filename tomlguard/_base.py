@@ -7,39 +7,17 @@
 ##-- builtin imports
 from __future__ import annotations
 
-# import abc
-import datetime
-import enum
 import functools as ftz
-import itertools as itz
 import logging as logmod
-import pathlib as pl
-import re
-import time
-import types
-import weakref
-# from copy import deepcopy
-# from dataclasses import InitVar, dataclass, field
-import typing
-from typing import (TYPE_CHECKING, Any, Callable, ClassVar, Final, Generic,
-                    Iterable, Iterator, Mapping, Match, MutableMapping,
-                    Protocol, Sequence, Tuple, TypeVar,
-                    cast, final, overload, runtime_checkable)
-from uuid import UUID, uuid1
-
-try:
-    # for py 3.10 onwards:
-    from typing import TypeAlias
-except ImportError:
-    TypeAlias = Any
+import sys
+from typing import Final
 
 ##-- end builtin imports
 
-from collections import ChainMap
 from collections.abc import Mapping, ItemsView, KeysView, ValuesView
 from tomlguard.error import TomlAccessError
 from tomlguard import TomlTypes
-from tomlguard.mixins.access_m import super_get, super_set
+from tomlguard.mixins.access_m import super_set
 
 ##-- logging
 logging = logmod.getLogger(__name__)
@@ -47,6 +25,9 @@ logging = logmod.getLogger(__name__)
 
 dict_items = type({}.items())
 
+ROOT       : Final[str]             = sys.intern("<root>")
+ROOT_INDEX : Final[tuple[str, ...]] = (ROOT,)
+
 
 class GuardBase(Mapping[str, TomlTypes]):
     """
@@ -59,16 +40,41 @@ class GuardBase(Mapping[str, TomlTypes]):
 
     while it can then report missing paths:
     data.report_defaulted() -> ['a.path.that.may.exist.<str|int>']
+
+    State is held in (name mangled) slots, so it can't shadow keys of the data,
+    and instances don't carry a __dict__.
     """
+    __slots__ = ("__table", "__index", "__mutable", "__children", "__aliases", "__repr")
 
-    def __init__(self, data:dict[str,TomlTypes]=None, *, index:None|list[str]=None, mutable:bool=False):
+    def __init__(self, data:dict[str,TomlTypes]=None, *, index:None|list[str]|tuple[str, ...]=None, mutable:bool=False):
         super().__init__()
-        super_set(self, "__table", data or {})
-        super_set(self, "__index"   , (index or ["<root>"])[:])
-        super_set(self, "__mutable" , mutable)
+        table = data or {}
+        if mutable and isinstance(table, Mapping):
+            # Writes go into the table, so don't let them reach the caller's dict
+            table = dict(table.items())
+
+        super_set(self, "_GuardBase__table"   , table)
+        super_set(self, "_GuardBase__index"   , tuple(index) if index else ROOT_INDEX)
+        super_set(self, "_GuardBase__mutable" , mutable)
+        super_set(self, "_GuardBase__children", None)
+        super_set(self, "_GuardBase__aliases" , None)
+        super_set(self, "_GuardBase__repr"    , None)
+
+    def __reduce__(self) -> tuple:
+        """ Copy and pickle by rebuilding from the table, index and mutability.
+        The caches are rebuilt lazily.
+        """
+        return (ftz.partial(self.__class__, index=self.__index, mutable=self.__mutable), (self.__table,))
 
     def __repr__(self) -> str:
-        return f"<TomlGuard:{list(self.keys())}>"
+        if self.__repr is not None:
+            return self.__repr
+
+        result = f"<TomlGuard:{list(self.keys())}>"
+        if not self.__mutable:
+            super_set(self, "_GuardBase__repr", result)
+
+        return result
 
     def __len__(self) -> int:
         return len(self._table())
@@ -77,37 +83,57 @@ class GuardBase(Mapping[str, TomlTypes]):
         raise TomlAccessError("Don't call a TomlGuard, call a TomlGuardProxy using methods like .on_fail")
 
     def __iter__(self):
-        return iter(getattr(self, "__table").items())
+        return iter(self.__table.items())
 
     def __contains__(self, _key: object) -> bool:
-        return _key in self.keys()
+        return _key in self.__table
 
-    def _index(self) -> list[str]:
-        return super_get(self, "__index")[:]
+    def _index(self) -> tuple[str, ...]:
+        return self.__index
 
     def _table(self) -> dict[str,TomlTypes]:
-        return super_get(self, "__table")
+        return self.__table
+
+    def _mutable(self) -> bool:
+        return self.__mutable
+
+    def _aliases(self) -> dict[str, str]:
+        """ Maps attribute style names (a_key) to the dashed keys (a-key) of the table.
+        Built on first use, and rebuilt each time if mutable.
+        """
+        if self.__aliases is not None:
+            return self.__aliases
+
+        aliases = {sys.intern(x.replace("-", "_")): x for x in self.__table.keys() if isinstance(x, str) and "-" in x}
+        if not self.__mutable:
+            super_set(self, "_GuardBase__aliases", aliases)
+
+        return aliases
+
+    def _children(self) -> dict[str, GuardBase|tuple[GuardBase, ...]]:
+        """ The sub-tables already wrapped on access, created on first use """
+        if self.__children is None:
+            super_set(self, "_GuardBase__children", {})
+
+        return self.__children
 
     def keys(self) -> KeysView[str]:
-        table = super_get(self, "__table")
-        return table.keys()
+        return self.__table.keys()
 
     def items(self) -> ItemsView[str, TomlTypes]:
-        match super_get(self, "__table"):
-            case dict() as val:
-                return val.items()
-            case list() as val:
-                return dict({self._index()[-1]: val}).items()
-            case GuardBase() as val:
-                return val.items()
-            case x:
-                raise TypeError("Unknown table type", x)
+        table = self.__table
+        if isinstance(table, Mapping):
+            return table.items()
+        if isinstance(table, list):
+            return dict({self._index()[-1]: table}).items()
+
+        raise TypeError("Unknown table type", table)
 
     def values(self) -> ValuesView[TomlTypes]:
-        match super_get(self, "__table"):
-            case dict() as val:
-                return val.values()
-            case list() as val:
-                return val
-            case _:
-                raise TypeError()
+        table = self.__table
+        if isinstance(table, Mapping):
+            return table.values()
+        if isinstance(table, list):
+            return table
+
+        raise TypeError()
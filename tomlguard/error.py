@@ -6,24 +6,8 @@
 ##-- builtin imports
 from __future__ import annotations
 
-# import abc
-import datetime
-import enum
-import functools as ftz
-import itertools as itz
 import logging as logmod
-import pathlib as pl
-import re
-import time
-import types
-import weakref
-# from copy import deepcopy
-# from dataclasses import InitVar, dataclass, field
-from typing import (TYPE_CHECKING, Any, Callable, ClassVar, Final, Generic,
-                    Iterable, Iterator, Mapping, Match, MutableMapping,
-                    Protocol, Sequence, Tuple, TypeVar,
-                    cast, final, overload, runtime_checkable)
-from uuid import UUID, uuid1
+from typing import Iterable
 
 ##-- end builtin imports
 
@@ -33,3 +17,16 @@ logging = logmod.getLogger(__name__)
 
 class TomlAccessError(AttributeError):
     pass
+
+class TomlMissingError(TomlAccessError):
+    """ A key missing from a guard.
+    Proxies catch these routinely, so the message is only joined together when it is displayed.
+    """
+
+    def __init__(self, index:tuple[str, ...], available:Iterable[str]):
+        super().__init__(index, available)
+        self.index     = index
+        self.available = available
+
+    def __str__(self) -> str:
+        return f"{'.'.join(self.index)} not found, available: [{' '.join(self.available)}]"
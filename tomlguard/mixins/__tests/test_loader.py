@@ -7,15 +7,16 @@ from __future__ import annotations
 
 import logging as logmod
 import pathlib as pl
+import sys
 from typing import (Any, Callable, ClassVar, Generic, Iterable, Iterator,
                     Mapping, Match, MutableMapping, Sequence, Tuple,
                     TypeVar, cast)
-import warnings
 
 ##-- end imports
 
 import pytest
 from tomlguard.tomlguard import TomlGuard
+from tomlguard.mixins.loader_m import _parse_cached
 
 logging = logmod.root
 
@@ -54,3 +55,66 @@ class TestTomlGuardLoader:
         assert("a-different-val" in simple)
         assert(simple.a_different_val == "blah")
         assert(simple.basic == "test")
+
+    def test_load_dir_merges_shared_tables(self, tmp_path):
+        (tmp_path / "first.toml").write_text("[tool.first]\nval = 1\n")
+        (tmp_path / "second.toml").write_text("[tool.second]\nval = 2\n")
+        simple = TomlGuard.load_dir(tmp_path)
+        assert(simple.tool.first.val == 1)
+        assert(simple.tool.second.val == 2)
+
+    def test_load_dir_extends_table_arrays(self, tmp_path):
+        (tmp_path / "first.toml").write_text("[[servers]]\nname = 'a'\n")
+        (tmp_path / "second.toml").write_text("[[servers]]\nname = 'b'\n")
+        simple = TomlGuard.load_dir(tmp_path)
+        assert([x.name for x in simple.servers] == ["a", "b"])
+
+    def test_load_dir_conflict(self, tmp_path):
+        (tmp_path / "first.toml").write_text("[tool]\nval = 1\n")
+        (tmp_path / "second.toml").write_text("[tool]\nval = 2\n")
+        with pytest.raises(IOError):
+            TomlGuard.load_dir(tmp_path)
+
+    def test_read_interns_keys(self):
+        simple = TomlGuard.read('[a_table]\n"a key" = [{"nested_key" = 1}]\n')
+        assert(next(iter(simple.keys())) is sys.intern("a_table"))
+        assert(next(iter(simple.a_table.keys())) is sys.intern("a key"))
+        assert(next(iter(simple.a_table['a key'][0].keys())) is sys.intern("nested_key"))
+
+    def test_load_reuses_parse(self, tmp_path):
+        target = tmp_path / "simple.toml"
+        target.write_text("[a_table]\nval = 1\n")
+        first  = TomlGuard.load(target)
+        hits   = _parse_cached.cache_info().hits
+        second = TomlGuard.load(target)
+        assert(_parse_cached.cache_info().hits == hits + 1)
+        assert(first.a_table._table() == second.a_table._table())
+
+    def test_load_doesnt_share_data(self, tmp_path):
+        target = tmp_path / "simple.toml"
+        target.write_text("[tool]\npaths = ['x']\n")
+        TomlGuard.load(target).tool.paths.append("X")
+        TomlGuard.load(target).tool._table()["other"] = 2
+        second = TomlGuard.load(target)
+        assert(second.tool.paths == ["x"])
+        assert("other" not in second.tool)
+
+    def test_load_reparses_changed_file(self, tmp_path):
+        target = tmp_path / "simple.toml"
+        target.write_text("val = 1\n")
+        assert(TomlGuard.load(target).val == 1)
+        target.write_text("val = 22\n")
+        assert(TomlGuard.load(target).val == 22)
+
+    def test_load_multiple_merges_tables(self, tmp_path):
+        (tmp_path / "first.toml").write_text("[tool]\nval = 1\n")
+        (tmp_path / "second.toml").write_text("[tool]\nother = 2\n")
+        simple = TomlGuard.load(tmp_path / "first.toml", tmp_path / "second.toml")
+        assert(simple.tool.val == 1)
+        assert(simple.tool.other == 2)
+
+    def test_load_multiple_extends_table_arrays(self, tmp_path):
+        (tmp_path / "first.toml").write_text("[[servers]]\nname = 'a'\n")
+        (tmp_path / "second.toml").write_text("[[servers]]\nname = 'b'\n")
+        simple = TomlGuard.load(tmp_path / "first.toml", tmp_path / "second.toml")
+        assert([x.name for x in simple.servers] == ["a", "b"])
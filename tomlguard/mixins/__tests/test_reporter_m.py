@@ -20,7 +20,6 @@ import logging as logmod
 import pathlib as pl
 import re
 import types
-import warnings
 from copy import deepcopy
 from dataclasses import InitVar, dataclass, field
 from time import sleep
@@ -60,23 +59,26 @@ class TestDefaultedReporter:
     def cleanup(self):
         pass
 
+    @pytest.fixture(scope="function")
+    def clean_defaulted(self):
+        DefaultedReporter_m.clear_defaulted()
+        yield
+        DefaultedReporter_m.clear_defaulted()
+
     def test_sanity(self):
         assert(True is True)
 
-    def test_proxied_report_empty(self, mocker):
-        mocker.patch.object(DefaultedReporter_m, "_defaulted", set())
+    def test_proxied_report_empty(self, clean_defaulted):
         base     = TomlGuard({"test": { "blah": {"bloo": "final", "aweg": "joijo"}}})
         assert(TomlGuard.report_defaulted() == [])
 
-    def test_proxied_report_no_existing_values(self, mocker):
-        mocker.patch.object(DefaultedReporter_m, "_defaulted", set())
+    def test_proxied_report_no_existing_values(self, clean_defaulted):
         base     = TomlGuard({"test": { "blah": {"bloo": "final", "aweg": "joijo"}}})
         base.test.blah.bloo
         base.test.blah.aweg
         assert(TomlGuard.report_defaulted() == [])
 
-    def test_proxied_report_missing_values(self, mocker):
-        mocker.patch.object(DefaultedReporter_m, "_defaulted", set())
+    def test_proxied_report_missing_values(self, clean_defaulted):
         base              = TomlGuard({"test": { "blah": {"bloo": "final", "aweg": "joijo"}}})
         base.on_fail(False).this.doesnt.exist()
         base.on_fail(False).test.blah.other()
@@ -85,8 +87,7 @@ class TestDefaultedReporter:
         assert("<root>.this.doesnt.exist = false # <Any>" in defaulted)
         assert("<root>.test.blah.other = false # <Any>" in defaulted)
 
-    def test_proxied_report_missing_typed_values(self, mocker):
-        mocker.patch.object(DefaultedReporter_m, "_defaulted", set())
+    def test_proxied_report_missing_typed_values(self, clean_defaulted):
         base     = TomlGuard({"test": { "blah": {"bloo": "final", "aweg": "joijo"}}})
         base.on_fail("aValue", str).this.doesnt.exist()
         base.on_fail(2, int).test.blah.other()
@@ -95,6 +96,34 @@ class TestDefaultedReporter:
         assert("<root>.this.doesnt.exist = 'aValue' # <str>" in defaulted)
         assert("<root>.test.blah.other = 2 # <int>" in defaulted)
 
-    @pytest.mark.skip("not implemented")
-    def test_proxied_report_no_duplicates(self):
-        raise NotImplementedError()
+    def test_report_sorted_and_updated(self, clean_defaulted):
+        base     = TomlGuard({"test": { "blah": {"bloo": "final", "aweg": "joijo"}}})
+        base.on_fail(2, int).zzz()
+        assert(TomlGuard.report_defaulted() == ["<root>.zzz = 2 # <int>"])
+        base.on_fail(2, int).aaa()
+        assert(TomlGuard.report_defaulted() == ["<root>.aaa = 2 # <int>", "<root>.zzz = 2 # <int>"])
+
+    def test_report_after_direct_clear(self, clean_defaulted):
+        base     = TomlGuard({"test": { "blah": {"bloo": "final", "aweg": "joijo"}}})
+        base.on_fail(2, int).x()
+        assert(TomlGuard.report_defaulted() == ["<root>.x = 2 # <int>"])
+        TomlGuard._defaulted.clear()
+        base.on_fail(2, int).y()
+        assert(TomlGuard.report_defaulted() == ["<root>.y = 2 # <int>"])
+
+    def test_add_defaulted_index_forms(self, clean_defaulted):
+        DefaultedReporter_m.add_defaulted(("<root>", "a", "b"), 2, "int")
+        DefaultedReporter_m.add_defaulted("<root>.a.b", 2, "int")
+        assert(TomlGuard.report_defaulted() == ["<root>.a.b = 2 # <int>"])
+
+    def test_proxied_report_no_duplicates(self, clean_defaulted):
+        base     = TomlGuard({"test": { "blah": {"bloo": "final", "aweg": "joijo"}}})
+        base.on_fail(2, int).zzz()
+        base.on_fail(2, int).zzz()
+        assert(TomlGuard.report_defaulted() == ["<root>.zzz = 2 # <int>"])
+
+    def test_proxied_report_unhashable_values(self, clean_defaulted):
+        base     = TomlGuard({"test": { "blah": {"bloo": "final", "aweg": "joijo"}}})
+        base.on_fail([1, 2], list).zzz()
+        base.on_fail([1, 2], list).zzz()
+        assert(TomlGuard.report_defaulted() == ["<root>.zzz = [1, 2] # <list>"])
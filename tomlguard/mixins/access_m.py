@@ -38,7 +38,7 @@ from weakref import ref
 
 from collections import ChainMap
 from collections.abc import Mapping, ItemsView, KeysView, ValuesView
-from tomlguard.error import TomlAccessError
+from tomlguard.error import TomlMissingError
 
 ##-- logging
 logging = logmod.getLogger(__name__)
@@ -46,34 +46,44 @@ logging = logmod.getLogger(__name__)
 
 super_get             = object.__getattribute__
 super_set             = object.__setattr__
+# Distinguishes a missing key from a key holding a falsy value, in a single probe:
+MISSING               = object()
 
 class TomlAccess_m:
     """ """
+    __slots__ = ()
 
     def __setattr__(self, attr:str, value:TomlTypes) -> None:
-        if not getattr(self, "__mutable"):
+        if not self._mutable():
             raise TypeError()
-        super_set(self, attr, value)
+
+        table = self._table()
+        key   = attr
+        if attr not in table and "_" in attr:
+            # Assign to an existing dashed key, instead of adding a second key beside it
+            key = self._aliases().get(attr, attr)
+
+        table[key] = value
+        self._children().pop(key, None)
 
     def __getattr__(self, attr:str) -> GuardBase | TomlTypes | list[GuardBase]:
+        if attr.startswith("_GuardBase__"):
+            # An unset slot, eg: on an instance still being built. Don't recurse into _table()
+            raise AttributeError(attr)
+
         table = self._table()
+        value = table.get(attr, MISSING)
+        if value is not MISSING:
+            return self._wrap(attr, value)
 
-        if attr not in table and attr.replace("_", "-") not in table:
-            index     = self._index() + [attr]
-            index_s   = ".".join(index)
-            available = " ".join(self.keys())
-            raise TomlAccessError(f"{index_s} not found, available: [{available}]")
-
-        match table.get(attr, None) or table.get(attr.replace("_", "-"), None):
-            case dict() as result:
-                return self.__class__(result, index=self._index() + [attr])
-            case list() as result if all(isinstance(x, dict) for x in result):
-                index = self._index()
-                return [self.__class__(x, index=index[:]) for x in result if isinstance(x, dict)]
-            case _ as result:
-                return result
-
-    def __getitem__(self, keys:str|list[str]|tuple[str]) -> TomlTypes:
+        # Only attribute names with an underscore can stand in for a dashed key:
+        key = self._aliases().get(attr, None) if "_" in attr else None
+        if key is None:
+            raise self._missing(attr)
+
+        return self._wrap(key, table[key])
+
+    def __getitem__(self, keys:str|list[str]|tuple[str, ...]) -> TomlTypes:
         curr : typing.Self = self
         match keys:
             case tuple():
@@ -86,9 +96,46 @@ class TomlAccess_m:
 
         return curr
 
-
-    def get(self, key:str, default:TomlTypes|None=None) -> TomlTypes|None:
-        if key in self:
-            return self[key]
-
-        return default
+    def get(self, key:str|tuple[str, ...], default:TomlTypes|None=None) -> TomlTypes|None:
+        """ Get a value, or the default if it is missing.
+        A tuple key walks sub-tables, eg: data.get(("a", "b", "c"), 2),
+        without allocating the proxies that data.on_fail(2).a.b.c() would.
+        """
+        if isinstance(key, tuple):
+            curr = self
+            for sub in key:
+                if not isinstance(curr, TomlAccess_m):
+                    return default
+                curr = curr.get(sub, MISSING)
+                if curr is MISSING:
+                    return default
+            return curr
+
+        value = self._table().get(key, MISSING)
+        if value is MISSING:
+            return default
+
+        return self._wrap(key, value)
+
+    def _missing(self, attr:str) -> TomlMissingError:
+        """ Only built when a lookup has actually failed """
+        return TomlMissingError(self._index() + (attr,), tuple(self.keys()))
+
+    def _wrap(self, attr:str, value:TomlTypes) -> GuardBase | TomlTypes | list[GuardBase]:
+        """ Wrap tables and arrays of tables found at `attr` as guards, reusing earlier wrappers """
+        if isinstance(value, dict):
+            children = self._children()
+            if attr not in children:
+                children[attr] = self.__class__(value, index=self._index() + (attr,))
+            return children[attr]
+
+        if not isinstance(value, list) or not value or not isinstance(value[0], dict):
+            return value
+        if not all(isinstance(x, dict) for x in value[1:]):
+            return value
+
+        children = self._children()
+        if attr not in children:
+            index = self._index()
+            children[attr] = tuple(self.__class__(x, index=index) for x in value)
+        return list(children[attr])
@@ -12,12 +12,14 @@ import enum
 import functools as ftz
 import itertools as itz
 import logging as logmod
+import os
 import pathlib as pl
 import re
+import sys
 import time
 import types
 import weakref
-# from copy import deepcopy
+from copy import deepcopy
 # from dataclasses import InitVar, dataclass, field
 from typing import (TYPE_CHECKING, Any, Callable, ClassVar, Final, Generic,
                     Iterable, Iterator, Mapping, Match, MutableMapping,
@@ -41,19 +43,83 @@ from tomlguard import TomlTypes
 from tomlguard.error import TomlAccessError
 
 try:
-    # For py 3.11 onwards:
-    import tomllib as toml
+    # Optional rust backed parser, the fastest option:
+    import rtoml as toml
 except ImportError:
-    # Fallback to external package
-    import toml
+    try:
+        # For py 3.11 onwards:
+        import tomllib as toml
+    except ImportError:
+        # Fallback to the package tomllib was adopted from
+        import tomli as toml
+
+def _intern_keys(data:TomlTypes) -> TomlTypes:
+    """ Intern the keys of parsed tables,
+    so lookups by (already interned) attribute names can match keys by identity
+    """
+    if isinstance(data, dict):
+        return {sys.intern(key): _intern_keys(val) for key, val in data.items()}
+    if isinstance(data, list) and any(isinstance(x, (dict, list)) for x in data):
+        return [_intern_keys(x) for x in data]
+
+    return data
+
+def _parse(text:str) -> dict[str, TomlTypes]:
+    return _intern_keys(toml.loads(text))
+
+PARSE_CACHE_SIZE : Final[int] = 128
+
+def _signature(path:str|pl.Path|os.DirEntry) -> tuple[str, int, int]:
+    """ Identify a file's current contents by path, modification time and size """
+    stat = path.stat() if isinstance(path, os.DirEntry) else os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+@ftz.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_cached(path:str, mtime:int, size:int) -> dict[str, TomlTypes]:
+    """ Parse a file, reusing the result until it changes. Never hand this result out directly """
+    return _parse(pl.Path(path).read_text())
+
+def _parse_file(path:str, mtime:int, size:int) -> dict[str, TomlTypes]:
+    """ A private copy of a file's parsed data.
+    Guards hand out raw lists and tables, so loads must not share them.
+    Copying is still several times cheaper than parsing again.
+    """
+    return deepcopy(_parse_cached(path, mtime, size))
+
+def _is_table_array(value:list) -> bool:
+    return bool(value) and all(isinstance(x, dict) for x in value)
+
+def _merge_tables(target:dict[str, TomlTypes], source:dict[str, TomlTypes]) -> dict[str, TomlTypes]:
+    """ Merge a parsed toml table into another, recursing into tables they share,
+    and extending arrays of tables ([[x]]) they share.
+    Any other shared key is a conflict, as it would be in a single toml file.
+    """
+    shared = target.keys() & source.keys()
+    if not shared:
+        target.update(source)
+        return target
+
+    for key in shared:
+        match target[key], source[key]:
+            case dict() as curr, dict() as new:
+                target[key] = _merge_tables(dict(curr), new)
+            case list() as curr, list() as new if _is_table_array(curr) and _is_table_array(new):
+                # A new list, rather than modifying either side
+                target[key] = curr + new
+            case _:
+                raise KeyError("Key Conflict:", key)
+
+    target.update((key, val) for key, val in source.items() if key not in shared)
+    return target
 
 class TomlLoader_m:
+    __slots__ = ()
 
     @classmethod
     def read(cls, text:str) -> Self:
         logging.debug("Reading TomlGuard for text")
         try:
-            return cls(toml.loads(text))
+            return cls(_parse(text))
         except Exception as err:
             raise IOError("TomlGuard Failed to Load: ", text, err.args) from err
 
@@ -69,11 +135,11 @@ class TomlLoader_m:
     def load(cls, *paths:str|pl.Path) -> Self:
         logging.debug("Creating TomlGuard for %s", paths)
         try:
-            texts = []
+            data = {}
             for path in paths:
-                texts.append(pl.Path(path).read_text())
+                _merge_tables(data, _parse_file(*_signature(path)))
 
-            return cls(toml.loads("\n".join(texts)))
+            return cls(data)
         except Exception as err:
             raise IOError("TomlGuard Failed to Load: ", paths, err.args) from err
 
@@ -81,10 +147,13 @@ class TomlLoader_m:
     def load_dir(cls, dirp:str|pl.Path) -> Self:
         logging.debug("Creating TomlGuard for directory: %s", str(dirp))
         try:
-            texts = []
-            for path in pl.Path(dirp).glob("*.toml"):
-                texts.append(path.read_text())
+            data = {}
+            with os.scandir(dirp) as entries:
+                for entry in sorted(entries, key=lambda x: x.name):
+                    if not (entry.name.endswith(".toml") and entry.is_file()):
+                        continue
+                    _merge_tables(data, _parse_file(*_signature(entry)))
 
-            return cls(toml.loads("\n".join(texts)))
+            return cls(data)
         except Exception as err:
             raise IOError("TomlGuard Failed to Directory: ", dirp, err.args) from err
@@ -31,6 +31,7 @@ from uuid import UUID, uuid1
 logging = logmod.getLogger(__name__)
 ##-- end logging
 
+from tomlguard._base import ROOT_INDEX
 from tomlguard.proxies.base import TomlGuardProxy
 from tomlguard.proxies.failure import TomlGuardFailureProxy
 from tomlguard.error import TomlAccessError
@@ -41,6 +42,7 @@ class GuardProxyEntry_m:
     eg:
     tg.on_fail(2, int).a.value() # either get a.value, or 2. whichever returns has to be an int.
     """
+    __slots__ = ()
 
     def on_fail(self, fallback:Any, types:Any|None=None, non_root=False) -> TomlGuardFailureProxy:
         """
@@ -49,9 +51,8 @@ class GuardProxyEntry_m:
 
         *without* throwing a TomlAccessError
         """
-        index = self._index()
-        if index != ["<root>"] and not non_root:
-            raise TomlAccessError("On Fail not declared at entry", index)
+        if not non_root and self._index() != ROOT_INDEX:
+            raise TomlAccessError("On Fail not declared at entry", self._index())
 
         return TomlGuardFailureProxy(self, types=types, fallback=fallback)
 
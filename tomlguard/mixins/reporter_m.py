@@ -40,33 +40,67 @@ from weakref import ref
 logging = logmod.getLogger(__name__)
 ##-- end logging
 
+DEFAULT_LINE     : Final[str]                                = "{} = {} # <{}>"
+# How to print a defaulted value, by its type. Anything else uses repr:
+VALUE_FORMATTERS : Final[dict[type, Callable[[Any], str]]] = {bool : lambda x: str(x).lower()}
+
+def _format_defaulted(index:str|tuple[str, ...], val:TomlTypes, types:str) -> str:
+    index_path = index if isinstance(index, str) else ".".join(index)
+    val_str    = VALUE_FORMATTERS.get(type(val), repr)(val)
+    return DEFAULT_LINE.format(index_path, val_str, types)
+
+# (index, types, type of value, value) -> value. Lines, and dotted index paths, are only formatted when reported:
+_DEFAULTED       : Final[dict[tuple, TomlTypes]]             = {}
+# Bumped by every registration and clear, so the report cache can't miss a change in place:
+_DEFAULTED_VERSION : int                                       = 0
+
 class DefaultedReporter_m:
+    __slots__ = ()
 
-    _defaulted : ClassVar[set[str]] = set()
+    _defaulted         : ClassVar[dict[tuple, TomlTypes]]           = _DEFAULTED
+    # The last report, and the registry version it was built from:
+    _defaulted_report  : ClassVar[tuple[int, tuple[str, ...]]|None] = None
 
     @staticmethod
-    def add_defaulted(index:str|list[str], val:TomlTypes, types:str="Any") -> None:
-        match index, val:
-            case list(), _:
-                raise TypeError("Tried to Register a default value with a list index, use a str")
-            case str(), bool():
-                index_str = f"{index} = {str(val).lower()} # <{types}>"
-            case str(), _:
-                index_str = f"{index} = {repr(val)} # <{types}>"
-            case [*xs], bool():
-                index_path = ".".join(xs)
-                index_str = f"{index_path} = {str(val).lower()} # <{types}>"
-            case [*xs], _:
-                index_path = ".".join(xs)
-                index_str = f"{index_path} = {val} # <{types}>"
-            case _, _:
-                raise TypeError("Unexpected Values found: ", val, index)
-
-        DefaultedReporter_m._defaulted.add(index_str)
+    def add_defaulted(index:str|tuple[str, ...], val:TomlTypes, types:str="Any") -> None:
+        global _DEFAULTED_VERSION
+        # Tuple indices are stored as is, and only joined when reported
+        if isinstance(index, list):
+            raise TypeError("Tried to Register a default value with a list index, use a str")
+        if not isinstance(index, (str, tuple)):
+            raise TypeError("Unexpected Values found: ", val, index)
+
+        try:
+            key = (index, types, type(val), val)
+            hash(key)
+        except TypeError:
+            # Unhashable values (arrays, tables) are keyed by their repr instead
+            key = (index, types, type(val), repr(val))
+
+        _DEFAULTED[key]    = val
+        _DEFAULTED_VERSION += 1
 
     @staticmethod
     def report_defaulted() -> list[str]:
         """
         Report the index paths inject default values
         """
-        return list(DefaultedReporter_m._defaulted)
+        match DefaultedReporter_m._defaulted_report:
+            case (ver, report) if ver == _DEFAULTED_VERSION:
+                pass
+            case _:
+                # A set, as str and tuple forms of the same index format the same
+                report = tuple(sorted({_format_defaulted(key[0], val, key[1]) for key, val in _DEFAULTED.items()}))
+                DefaultedReporter_m._defaulted_report = (_DEFAULTED_VERSION, report)
+
+        return list(report)
+
+    @staticmethod
+    def clear_defaulted() -> None:
+        """
+        Forget all registered default values, eg: between tests
+        """
+        global _DEFAULTED_VERSION
+        _DEFAULTED.clear()
+        _DEFAULTED_VERSION                  += 1
+        DefaultedReporter_m._defaulted_report = None
@@ -36,6 +36,7 @@ try:
     import tomli_w
 
     class TomlWriter_m:
+        __slots__ = ()
 
         def __str__(self) -> str:
             return tomli_w.dumps(self._table())
@@ -47,6 +48,7 @@ except ImportError:
     logging.debug("No Tomli-w found, TomlGuard will not write toml, only read it")
 
     class TomlWriter_m:
+        __slots__ = ()
 
         def to_file(self, path:pl.Path) -> None:
             raise NotImplementedError("Tomli-w isn't installed, so TomlGuard can't write, only read")
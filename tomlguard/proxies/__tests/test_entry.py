@@ -6,7 +6,6 @@
 from __future__ import annotations
 
 import logging as logmod
-import warnings
 import pathlib as pl
 from typing import (Any, Callable, ClassVar, Generic, Iterable, Iterator,
                     Mapping, Match, MutableMapping, Sequence, Tuple, TypeVar, cast)
@@ -20,53 +19,54 @@ from tomlguard.proxies.failure import TomlGuardFailureProxy
 
 logging = logmod.root
 
+@pytest.fixture(scope="module")
+def base_simple():
+    return TomlGuard({"test": "blah"})
+
+@pytest.fixture(scope="module")
+def base_nested():
+    return TomlGuard({"test": { "blah": {"bloo": "final"}}})
+
 class TestProxiedTomlGuard:
 
-    def test_initial(self):
-        base = TomlGuard({"test": "blah"})
-        proxied = base.on_fail("aweg")
+    def test_initial(self, base_simple):
+        proxied = base_simple.on_fail("aweg")
         assert(isinstance(proxied, TomlGuardFailureProxy))
         assert(isinstance(proxied.doesnt_exist, TomlGuardFailureProxy))
 
-    def test_proxy_on_existing_key(self):
-        base = TomlGuard({"test": "blah"})
-        proxied = base.on_fail("aweg")
+    def test_proxy_on_existing_key(self, base_simple):
+        proxied = base_simple.on_fail("aweg")
         assert("blah" == proxied.test())
 
-    def test_proxy_on_bad_key(self):
-        base    = TomlGuard({"test": "blah"})
-        proxied = base.on_fail("aweg")
+    def test_proxy_on_bad_key(self, base_simple):
+        proxied = base_simple.on_fail("aweg")
         assert("aweg" == proxied.awehjo())
 
-    def test_proxy_index_independence(self):
-        base    = TomlGuard({"test": "blah"})
-        base_val = base.test
-        proxied = base.on_fail("aweg")
+    def test_proxy_index_independence(self, base_simple):
+        base_val = base_simple.test
+        proxied = base_simple.on_fail("aweg")
         good_key = proxied.test
         bad_key = proxied.ajojo
 
-        assert(base._index() == ["<root>"])
-        assert(proxied._index() == ["<root>"])
-        assert(good_key._index() == ["<root>", "test"])
-        assert(bad_key._index() == ["<root>", "ajojo"])
+        assert(base_simple._index() == ("<root>",))
+        assert(proxied._index() == ("<root>",))
+        assert(good_key._index() == ("<root>", "test"))
+        assert(bad_key._index() == ("<root>", "ajojo"))
 
-    def test_proxy_multi_independence(self):
-        base     = TomlGuard({"test": "blah"})
-        proxied  = base.on_fail("aweg")
-        proxied2 = base.on_fail("jioji")
+    def test_proxy_multi_independence(self, base_simple):
+        proxied  = base_simple.on_fail("aweg")
+        proxied2 = base_simple.on_fail("jioji")
         assert(proxied is not proxied2)
         assert("aweg" == proxied.awehjo())
         assert("jioji" == proxied2.awjioq())
 
-    def test_proxy_value_retrieval(self):
-        base     = TomlGuard({"test": "blah"})
-        proxied = base.on_fail("aweg").test
+    def test_proxy_value_retrieval(self, base_simple):
+        proxied = base_simple.on_fail("aweg").test
         assert(isinstance(proxied, TomlGuardFailureProxy))
         assert(proxied() == "blah")
 
-    def test_proxy_nested_value_retrieval(self):
-        base     = TomlGuard({"test": { "blah": {"bloo": "final"}}})
-        proxied = base.on_fail("aweg").test.blah.bloo
+    def test_proxy_nested_value_retrieval(self, base_nested):
+        proxied = base_nested.on_fail("aweg").test.blah.bloo
         assert(isinstance(proxied, TomlGuardFailureProxy))
         assert(proxied() == "final")
 
@@ -86,20 +86,17 @@ class TestProxiedTomlGuard:
         assert(isinstance(proxied, TomlGuardFailureProxy))
         assert(proxied() is "aweg")
 
-    def test_proxy_fallback(self):
-        base     = TomlGuard({"test": { "blah": {"bloo": "final"}}})
-        proxied = base.on_fail("aweg").test.blah.missing
+    def test_proxy_fallback(self, base_nested):
+        proxied = base_nested.on_fail("aweg").test.blah.missing
         assert(isinstance(proxied, TomlGuardFailureProxy))
         assert(proxied() == "aweg")
 
-    def test_no_proxy_error(self):
-        base     = TomlGuard({"test": { "blah": {"bloo": "final"}}})
+    def test_no_proxy_error(self, base_nested):
         with pytest.raises(TomlAccessError):
-            base.test.blah()
+            base_nested.test.blah()
 
-    def test_proxy_early_check(self):
-        base     = TomlGuard({"test": { "blah": {"bloo": "final"}}})
-        proxied = base.on_fail("aweg").test
+    def test_proxy_early_check(self, base_nested):
+        proxied = base_nested.on_fail("aweg").test
         assert(isinstance(proxied, TomlGuardFailureProxy))
 
     def test_proxy_multi_use(self):
@@ -108,3 +105,19 @@ class TestProxiedTomlGuard:
         assert(proxied.bloo() == "final")
         assert(proxied.aweg() == "joijo")
 
+
+    def test_proxy_multi_item(self, base_nested):
+        proxied = base_nested.on_fail("aweg")["test", "blah", "bloo"]
+        assert(isinstance(proxied, TomlGuardFailureProxy))
+        assert(proxied._index() == ("<root>", "test", "blah", "bloo"))
+        assert(proxied() == "final")
+
+    def test_proxy_multi_item_missing(self, base_nested):
+        proxied = base_nested.on_fail("aweg")["test", "missing", "bloo"]
+        assert(proxied._index() == ("<root>", "test", "missing", "bloo"))
+        assert(proxied() == "aweg")
+
+    def test_proxy_multi_item_past_value(self, base_nested):
+        proxied = base_nested.on_fail("aweg")["test", "blah", "bloo", "further"]
+        assert(proxied._index() == ("<root>", "test", "blah", "bloo", "further"))
+        assert(proxied() == "final")
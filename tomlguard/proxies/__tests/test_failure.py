@@ -6,7 +6,6 @@
 from __future__ import annotations
 
 import logging as logmod
-import warnings
 import pathlib as pl
 from typing import (Any, Callable, ClassVar, Generic, Iterable, Iterator,
                     Mapping, Match, MutableMapping, Sequence, Tuple,
@@ -14,6 +13,8 @@ from typing import (Any, Callable, ClassVar, Generic, Iterable, Iterator,
 ##-- end imports
 logging = logmod.root
 
+import typing
+
 import pytest
 from tomlguard.proxies.failure import TomlGuardFailureProxy
 from tomlguard.proxies.base import TomlGuardProxy
@@ -24,6 +25,14 @@ class TestFailureProxy:
         proxy = TomlGuardFailureProxy(None, fallback=2)
         assert(isinstance(proxy, TomlGuardProxy))
 
+    def test_slotted(self):
+        proxy = TomlGuardFailureProxy(None, fallback=2)
+        with pytest.raises(AttributeError):
+            object.__getattribute__(proxy, "__dict__")
+
+        with pytest.raises(AttributeError):
+            object.__getattribute__(proxy.blah, "__dict__")
+
     def test_attr(self):
         proxy = TomlGuardFailureProxy(None, fallback=2)
         accessed = proxy.blah.bloo
@@ -103,19 +112,27 @@ class TestFailureProxy:
         with pytest.raises(TypeError):
             TomlGuardFailureProxy(None, fallback="blah", types=int)
 
-    def test_proxy_inject(self):
+    def test_types_str_keeps_spelling(self):
+        first  = TomlGuardFailureProxy(None, fallback=2, types=int|str)
+        second = TomlGuardFailureProxy(None, fallback=2, types=str|int)
+        third  = TomlGuardFailureProxy(None, fallback=2, types=typing.Union[str, int])
+        assert(first._types_str() == "int | str")
+        assert(second._types_str() == "str | int")
+        assert(third._types_str() == "typing.Union[str, int]")
+
+    def test_proxy_clone(self):
         proxy1 = TomlGuardFailureProxy(None, fallback=2, types=int)
-        proxy2 = proxy1._inject(5)
+        proxy2 = proxy1._clone(5)
         assert(proxy2() == 5)
 
     def test_proxy_value_retrieval_typecheck_fail(self):
         proxy1 = TomlGuardFailureProxy(None, fallback=2, types=int)
         with pytest.raises(TypeError):
-            proxy1._inject("blah")()
+            proxy1._clone("blah")()
 
-    def test_proxy_inject_index_update(self):
+    def test_proxy_clone_index_update(self):
         proxy1 = TomlGuardFailureProxy(None, fallback=2, types=int).blah.bloo
-        proxy2 = proxy1._inject(5).awef
-        assert(proxy1._index() == ["<root>", "blah", "bloo"])
-        assert(proxy2._index() == ["<root>", "blah", "bloo", "awef"])
+        proxy2 = proxy1._clone(5).awef
+        assert(proxy1._index() == ("<root>", "blah", "bloo"))
+        assert(proxy2._index() == ("<root>", "blah", "bloo", "awef"))
         assert(proxy2() == 5)
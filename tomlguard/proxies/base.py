@@ -19,6 +19,7 @@ import itertools as itz
 import logging as logmod
 import pathlib as pl
 import re
+import sys
 import time
 import types
 import weakref
@@ -35,7 +36,7 @@ from weakref import ref
 
 # ##-- end stdlib imports
 
-from tomlguard._base import GuardBase
+from tomlguard._base import GuardBase, ROOT_INDEX
 from tomlguard.mixins.reporter_m import DefaultedReporter_m
 
 ##-- logging
@@ -44,19 +45,54 @@ logging = logmod.getLogger(__name__)
 
 NullFallback = NoReturn
 
+TYPES_STR_CACHE_SIZE : Final[int]                        = 256
+# id(declaration) -> (declaration, str).
+# Keyed by identity, as equal declarations (str|int, int|str, Union[str, int]) print differently.
+# Holding the declaration keeps its id from being reused.
+_TYPES_STRS          : Final[dict[int, tuple[Any, str]]] = {}
+
+def _types_to_str(targ:Any) -> str:
+    """ The declared types of a proxy, as shown in reports and errors.
+    Cached, as the same few declarations are used by many proxies
+    """
+    match _TYPES_STRS.get(id(targ), None):
+        case (cached, types_str) if cached is targ:
+            return types_str
+        case _:
+            pass
+
+    if isinstance(targ, types.UnionType):
+        types_str = repr(targ)
+    elif isinstance(targ, type):
+        types_str = targ.__name__
+    else:
+        types_str = str(targ)
+
+    if TYPES_STR_CACHE_SIZE <= len(_TYPES_STRS):
+        _TYPES_STRS.clear()
+
+    _TYPES_STRS[id(targ)] = (targ, types_str)
+    return types_str
+
 class TomlGuardProxy:
     """ A Base Class for Proxies """
+    __slots__ = ("_types", "_data", "_fallback", "__index", "_repr_cache")
 
-    def __init__(self, data:GuardBase, types:Any=None, index:list[str]|None=None, fallback:TomlTypes|NullFallback=NullFallback):
+    def __init__(self, data:GuardBase, types:Any=None, index:tuple[str, ...]|list[str]|None=None, fallback:TomlTypes|NullFallback=NullFallback):
         super().__init__()
         self._types                         = types or Any
         self._data                          = data
-        self.__index : list[str]            = index or ["<root>"]
+        self._fallback                      = fallback
+        self.__index : tuple[str, ...]      = tuple(index) if index else ROOT_INDEX
+        self._repr_cache : str|None         = None
 
     def __repr__(self) -> str:
-        type_str = self._types_str()
-        index_str = ".".join(self._index())
-        return f"<TomlGuardProxy: {index_str}:{type_str}>"
+        if self._repr_cache is None:
+            type_str = self._types_str()
+            index_str = ".".join(self._index())
+            self._repr_cache = f"<TomlGuardProxy: {index_str}:{type_str}>"
+
+        return self._repr_cache
 
     def __len__(self) -> int:
         if hasattr(self._data, "__len__"):
@@ -70,55 +106,51 @@ class TomlGuardProxy:
     def __call__(self, *, wrapper:callable[[TomlTypes], Any]|None=None, **kwargs) -> Any:
         return None
 
-
-    def _inject(self, val:tuple[Any]=NullFallback, attr:str|None=None, clear:bool=False) -> TomlGuardProxy:
-        match val:
-            case _ if clear:
-                val = NullFallback
-            case x if x is NullFallback:
-                val = self._data
-            case _:
-                pass
-
-        return TomlGuardProxy(val,
-                              types=self._types,
-                              index=self._index(attr),
-                              fallback=self._fallback)
+    def _clone(self, val:TomlTypes|NullFallback, *attrs:str) -> TomlGuardProxy:
+        """ Build the next proxy of an access chain.
+        Skips __init__, as the fallback was already checked when the chain started.
+        Each step is a new proxy, so earlier points in a chain can still be reused.
+        """
+        clone              = object.__new__(self.__class__)
+        clone._types       = self._types
+        clone._data        = val
+        clone._fallback    = self._fallback
+        clone.__index      = self._index(*attrs)
+        clone._repr_cache  = None
+        return clone
 
     def _notify(self) -> None:
-        types_str = self._types_str()
         match self._data, self._fallback, self._index():
             case GuardBase(), _, _:
                 pass
             case _, _, []:
                 pass
-            case x , val, [*index] if x is NullFallback:
-                DefaultedReporter_m.add_defaulted(".".join(index), val, types_str)
-            case val, _, [*index]:
-                DefaultedReporter_m.add_defaulted(".".join(index), val, types_str)
+            case x , val, tuple() as index if x is NullFallback:
+                DefaultedReporter_m.add_defaulted(index, val, self._types_str())
+            case val, _, tuple() as index:
+                DefaultedReporter_m.add_defaulted(index, val, self._types_str())
             case val, flbck, index,:
                 raise TypeError("Unexpected Values found: ", val, index, flbck)
 
     def _types_str(self) -> str:
-        match self._types:
-            case types.UnionType() as targ:
-                types_str = repr(targ)
-            case type(__name__=targ):
-                types_str = targ
-            case _ as targ:
-                types_str = str(targ)
-
-        return types_str
+        return _types_to_str(self._types)
 
     def _match_type(self, val:TomlTypes) -> TomlTypes:
-        if self._types != Any and not isinstance(val, self._types):
-            types_str = self._types_str()
-            index_str  = ".".join(self.__index + ['(' + types_str + ')'])
-            raise TypeError("TomlProxy Value doesn't match declared Type: ", index_str, val, self._types)
+        if self._types is not Any and not isinstance(val, self._types):
+            raise TypeError("TomlProxy Value doesn't match declared Type: ", self._type_error_index(), val, self._types)
 
         return val
 
-    def _index(self, sub:str=None) -> list[str]:
-        if sub is None:
-            return self.__index[:]
-        return self.__index[:] + [sub]
+    def _type_error_index(self) -> str:
+        """ Only built when a type mismatch is actually raised """
+        return ".".join(self.__index + ('(' + self._types_str() + ')',))
+
+    def _index(self, *subs:str) -> tuple[str, ...]:
+        """ The index is an immutable tuple, so it is shared instead of copied """
+        if not subs:
+            return self.__index
+        if len(subs) == 1:
+            # The common case, a single attribute step, without building a generator
+            return self.__index + (sys.intern(subs[0]),)
+
+        return self.__index + tuple(sys.intern(x) for x in subs)
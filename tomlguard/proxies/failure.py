@@ -70,8 +70,9 @@ class TomlGuardFailureProxy(TomlGuardProxy):
     and reports that to GuardBase when called.
     It also can type check its value and the value retrieved from the toml data
     """
+    __slots__ = ()
 
-    def __init__(self, data:GuardBase, types:Any=None, index:list[str]|None=None, fallback:TomlTypes|NullFallback=NullFallback):
+    def __init__(self, data:GuardBase, types:Any=None, index:tuple[str, ...]|list[str]|None=None, fallback:TomlTypes|NullFallback=NullFallback):
         super().__init__(data, types=types, index=index)
         if fallback == (None,):
             self._fallback = None
@@ -105,38 +106,33 @@ class TomlGuardFailureProxy(TomlGuardProxy):
         return self._match_type(val)
 
     def __getattr__(self, attr:str) -> TomlGuardProxy:
-        try:
-            match self._data:
-                case x if x is NullFallback:
-                    raise TomlAccessError()
-                case GuardBase():
-                    return self._inject(self._data[attr], attr=attr)
-                case _:
-                    return self._inject(attr=attr)
-        except TomlAccessError:
-            return self._inject(clear=True, attr=attr)
-
-    def __getitem__(self, keys:str|tuple[str]) -> TomlGuardProxy:
-        curr = self
-        match keys:
-            case tuple():
-                for key in keys:
-                    curr = curr.__getattr__(key)
-            case str():
-                curr = self.__getattr__(keys)
+        data = self._data
+        if isinstance(data, GuardBase):
+            try:
+                data = data[attr]
+            except TomlAccessError:
+                data = NullFallback
 
-        return curr
+        return self._clone(data, attr)
 
-    def _inject(self, val:tuple[Any]=NullFallback, attr:str|None=None, clear:bool=False) -> TomlGuardProxy:
-        match val:
-            case _ if clear:
-                val = NullFallback
-            case x if x is NullFallback:
-                val = self._data
-            case _:
+    def __getitem__(self, keys:str|tuple[str, ...]) -> TomlGuardProxy:
+        match keys:
+            case str():
+                return self.__getattr__(keys)
+            case tuple():
                 pass
-
-        return TomlGuardFailureProxy(val,
-                                     types=self._types,
-                                     index=self._index(attr),
-                                     fallback=self._fallback)
+            case _:
+                return self
+
+        # Walk the whole key path, then build a single proxy for its end
+        data = self._data
+        for key in keys:
+            if not isinstance(data, GuardBase):
+                break
+            try:
+                data = data[key]
+            except TomlAccessError:
+                data = NullFallback
+                break
+
+        return self._clone(data, *keys)
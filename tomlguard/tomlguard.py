@@ -23,6 +23,8 @@ we can skip dict style key access
 from __future__ import annotations
 
 import abc
+import collections
+import itertools as itz
 import logging as logmod
 import pathlib as pl
 from copy import deepcopy
@@ -47,16 +49,8 @@ try:
 except ImportError:
     Self = Any
 
-try:
-    # For py 3.11 onwards:
-    import tomllib as toml
-except ImportError:
-    # Fallback to external package
-    import toml
-
 ##-- end imports
 
-from collections import ChainMap
 from tomlguard._base import GuardBase
 from tomlguard.error import TomlAccessError
 from tomlguard.mixins.proxy_m import GuardProxyEntry_m
@@ -72,6 +66,7 @@ logging = logmod.getLogger(__name__)
 MIXINS : Final[list[type]] = (GuardProxyEntry_m, TomlLoader_m, TomlWriter_m, TomlAccess_m, DefaultedReporter_m)
 
 class TomlGuard(*MIXINS, GuardBase):
+    __slots__ = ()
 
     @classmethod
     def merge(cls, *tomlguards:Self, dfs:callable=None, index=None, shadow=False) -> Self:
@@ -85,16 +80,20 @@ class TomlGuard(*MIXINS, GuardBase):
 
         # TODO if given a dfs callable, use it to merge more intelligently
         """
-        curr_keys = set()
-        # Check for conflicts:
-        for data in tomlguards:
-            new_keys = set(data.keys())
-            if bool(curr_keys & new_keys) and not shadow:
-                raise KeyError("Key Conflict:", curr_keys & new_keys)
-            curr_keys |= new_keys
-
-        # Build a TG from a chainmap
-        return TomlGuard.from_dict(ChainMap(*(dict(x) for x in tomlguards)))
+        # Merge the raw tables, without re-wrapping their values.
+        # Key order is by first appearance, updating in reverse gives earlier tables priority
+        tables = [x._table() if isinstance(x, GuardBase) else x for x in tomlguards]
+        merged = dict.fromkeys(itz.chain.from_iterable(x.keys() for x in tables))
+        if not shadow and len(merged) != sum(len(x) for x in tables):
+            # Some key appeared more than once, only now find which:
+            counts    = collections.Counter(itz.chain.from_iterable(x.keys() for x in tables))
+            conflicts = {x for x, count in counts.items() if 1 < count}
+            raise KeyError("Key Conflict:", conflicts)
+
+        for table in reversed(tables):
+            merged.update(table.items())
+
+        return TomlGuard.from_dict(merged)
 
     def remove_prefix(self, prefix) -> TomlGuard:
         """ Try to remove a prefix from loaded data